@@ -0,0 +1,16 @@
+from dotenv import load_dotenv
+from pathlib import Path
+import os
+
+# Carrega o .env uma única vez; os demais módulos importam daqui
+load_dotenv()
+api_key = os.getenv("API_KEY")
+api_model = os.getenv("API_MODEL", "gemini-1.5-flash-latest")
+obsidian_vault_name = os.getenv("OBSIDIAN_VAULT_NAME")
+vault_path = Path(os.getenv("VAULT_PATH", "./vault"))
+cache_path = vault_path / ".feedcache"
+gemini_cache_path = vault_path / ".gemini_cache"
+
+# Cria os diretórios (vault e caches) se não existirem
+cache_path.mkdir(parents=True, exist_ok=True)
+gemini_cache_path.mkdir(exist_ok=True)
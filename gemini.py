@@ -1,73 +1,136 @@
-from dotenv import load_dotenv
+from config import api_key, api_model, gemini_cache_path
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+from typing_extensions import TypedDict
+import functools
 import google.generativeai as genai
-import os
+import hashlib
+import logging
 
-load_dotenv()
-api_key = os.getenv("API_KEY")
-api_model = os.getenv("API_MODEL")
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
 
+    _loads = json.loads
 
-def generate_summary(
-    main_link: str,
-    daily_stoic_link: str,
-) -> str:
-    """
-    Gera resumo, pontos-chave e citação para a nota no formato especificado
-    """
-    try:
-        genai.configure(api_key=api_key, transport="rest")
-        model = genai.GenerativeModel(api_model)
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
-        prompt = f"""\
-# TAREFA DE ANÁLISE ESTRUTURADA PARA OBSIDIAN
+# Configuração única do cliente, feita na importação do módulo
+genai.configure(api_key=api_key, transport="rest")
 
-## FUNÇÃO:
-Você é um assistente de pesquisa acadêmica especializado em extração e formatação rigorosa.
+SUMMARY_CACHE_TTL = timedelta(hours=24)
 
-## INSTRUÇÕES:
-1. Acesse e analise SEPARADAMENTE:
-    - Conteúdo principal: '{main_link}'
-    - Daily Stoic: '{daily_stoic_link}'
+SYSTEM_INSTRUCTION = """\
+Você é um assistente de pesquisa acadêmica. Para cada par de links recebido, \
+analise SEPARADAMENTE o conteúdo principal e o Daily Stoic.
 
-2. Para o conteúdo principal:
-    a. RESUMO: 3-5 parágrafos técnicos com definições precisas e contexto epistemológico
-    b. PONTOS-CHAVE: 3-5 elementos com:
-        - Título conciso (max 7 palavras)
-        - Descrição objetiva (1 frase)
-        - Aplicação prática (1 exemplo concreto)
+Conteúdo principal:
+- resumo: 3-5 parágrafos técnicos, sem markdown, com definições precisas, \
+contexto epistemológico, escolas de pensamento e contexto histórico quando \
+aplicável.
+- pontos_chave: 3-5 itens com titulo conciso (máx. 7 palavras), descricao \
+objetiva (1 frase) e aplicacao prática (1 exemplo concreto).
 
-3. Para o Daily Stoic:
-    a. Extraia a citação COMPLETA do dia
-    b. Traduza literalmente para português entre > e -
-    c. Retorne a citação traduzida mantendo a formatação exata do exemplo
+Daily Stoic:
+- citacao: citação COMPLETA do dia traduzida literalmente para português \
+(texto) e seu autor.
+"""
 
-## FORMATO OBRIGATÓRIO:
-```markdown
-## Resumo:
-[Conteúdo analítico sem markdown. Inclua referências a escolas de pensamento e contexto histórico quando aplicável.]
 
-## Pontos-chave:
-- **Título 1:** Descrição objetiva.
-    - **Aplicação prática:** Exemplo específico.
+class GeminiError(Exception):
+    """Falha ao gerar a análise com o Gemini."""
 
-(Repetir para 3-5 pontos)
 
----
+class PontoChave(TypedDict):
+    titulo: str
+    descricao: str
+    aplicacao: str
 
-## Citação do dia:
-> "[Tradução literal]"
-- [Autor]```
-"""
 
-        response = model.generate_content(prompt)
-        return response.text
+class Citacao(TypedDict):
+    texto: str
+    autor: str
 
-    except Exception as e:
-        return f"""## Resumo:
-Erro na análise. Leia o artigo manualmente.
 
-## Pontos-chave:
-- {str(e)}
+class Analise(TypedDict):
+    """Esquema da resposta JSON exigida do Gemini."""
+
+    resumo: str
+    pontos_chave: List[PontoChave]
+    citacao: Citacao
+
+
+# Extração determinística: temperatura baixa e saída limitada
+GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": Analise,
+    "temperature": 0.2,
+    "max_output_tokens": 2048,
+    "candidate_count": 1,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _model_for(model_name: str) -> genai.GenerativeModel:
+    """Instância do modelo reutilizada entre chamadas, por nome de modelo."""
+    return genai.GenerativeModel(
+        model_name, system_instruction=SYSTEM_INSTRUCTION
+    )
+
+
+def _summary_cache_file(main_link: str, daily_stoic_link: str) -> Path:
+    """Arquivo de cache da análise para o modelo e o par de links."""
+    key = f"{api_model}\n{main_link}\n{daily_stoic_link}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return gemini_cache_path / f"{digest}.json"
+
 
-## Citação do dia:
-> Citação não disponível"""
+@functools.lru_cache(maxsize=64)
+def generate_summary(
+    main_link: str,
+    daily_stoic_link: str,
+) -> Analise:
+    """
+    Gera resumo, pontos-chave e citação para a nota como um objeto
+    estruturado (modo JSON do Gemini).
+
+    O resultado é memorizado no processo e salvo em disco por
+    `SUMMARY_CACHE_TTL`, de modo que reexecuções com os mesmos links não
+    repetem a chamada ao modelo.
+
+    Raises:
+        GeminiError: Se a chamada ao modelo ou a decodificação da resposta
+            falhar.
+    """
+    cache_file = _summary_cache_file(main_link, daily_stoic_link)
+    try:
+        age = datetime.now().timestamp() - cache_file.stat().st_mtime
+        if age < SUMMARY_CACHE_TTL.total_seconds():
+            return _loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass  # Sem cache válido: consulta o modelo
+
+    try:
+        model = _model_for(api_model)
+
+        prompt = (
+            f"Conteúdo principal: '{main_link}'\n"
+            f"Daily Stoic: '{daily_stoic_link}'"
+        )
+
+        response = model.generate_content(
+            prompt, generation_config=GENERATION_CONFIG
+        )
+        analise = _loads(response.text)
+
+    except Exception as e:
+        raise GeminiError(str(e)) from e
+
+    try:
+        cache_file.write_bytes(_dumps(analise))
+    except OSError as e:
+        logging.error(f"Erro ao salvar cache do Gemini: {str(e)}")
+    return analise
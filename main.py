@@ -1,22 +1,13 @@
+from config import obsidian_vault_name, vault_path
 from datetime import datetime
-from dotenv import load_dotenv
-from pathlib import Path
 from sources import get_content
-from gemini import generate_summary
+from gemini import GeminiError, generate_summary
 from urllib.parse import quote
 import logging
 import os
 import webbrowser
-import re
 
 
-load_dotenv()
-obsidian_vault_name = os.getenv("OBSIDIAN_VAULT_NAME")
-vault_path = Path(os.getenv("VAULT_PATH", "./vault"))
-
-# Cria o diretório se não existir
-vault_path.mkdir(parents=True, exist_ok=True)
-
 # Configurar logging
 logging.basicConfig(
     filename=vault_path / "knowledge_drop_errors.log",
@@ -25,6 +16,9 @@ logging.basicConfig(
     encoding="utf-8",
 )
 
+# Caracteres inválidos em nomes de arquivo
+_UNSAFE_TBL = str.maketrans("", "", '\\/*?:"<>|')
+
 
 def create_daily_note(
     title: str, link: str, category: str, daily_stoic_link: str
@@ -49,39 +43,31 @@ def create_daily_note(
         # Gerar análise do Gemini apenas com link e título
         try:
             gemini_response = generate_summary(link, daily_stoic_link)
-        except Exception as e:
-            logging.error(f"Erro no Gemini: {str(e)}")
-            gemini_response = ""  # Fallback para resposta vazia
+        except GeminiError:
+            logging.exception("Erro no Gemini")
+            gemini_response = {}  # Mantém as seções padrão
 
-        # Extrair seções da resposta
+        # Montar seções a partir da resposta estruturada
         if gemini_response:
             try:
-                # Resumo: Captura tudo entre 'Resumo:' e 'Pontos-chave'
-                resumo_match = re.search(
-                    r"## Resumo:?(.*?)(?=## Pontos-chave|###|$)",
-                    gemini_response,
-                    re.IGNORECASE | re.DOTALL,
-                )
-                if resumo_match:
-                    sections["resumo"] = resumo_match.group(1).strip()
-
-                # Pontos-chave: Captura tudo entre 'Pontos-chave' e 'Citação'
-                pontos_match = re.search(
-                    r"## Pontos-chave:?(.*?)(?=## Citação|###|$)",
-                    gemini_response,
-                    re.IGNORECASE | re.DOTALL,
-                )
-                if pontos_match:
-                    sections["pontos_chave"] = pontos_match.group(1).strip()
-
-                # Citação: Captura o bloco completo
-                citacao_match = re.search(
-                    r"## Citação do dia:?(.*?)(?=##|\Z)",
-                    gemini_response,
-                    re.IGNORECASE | re.DOTALL,
-                )
-                if citacao_match:
-                    sections["citacao"] = citacao_match.group(1).strip()
+                resumo = gemini_response.get("resumo", "").strip()
+                if resumo:
+                    sections["resumo"] = resumo
+
+                pontos = gemini_response.get("pontos_chave") or []
+                if pontos:
+                    sections["pontos_chave"] = "\n".join(
+                        f"- **{ponto['titulo']}:** {ponto['descricao']}\n"
+                        f"    - **Aplicação prática:** {ponto['aplicacao']}"
+                        for ponto in pontos
+                    )
+
+                citacao = gemini_response.get("citacao") or {}
+                if citacao.get("texto"):
+                    texto = citacao["texto"].strip().strip('"“”')
+                    sections["citacao"] = (
+                        f'> "{texto}"\n- {citacao.get("autor", "").strip()}'
+                    )
 
             except Exception as e:
                 logging.error(f"Erro ao processar resposta Gemini: {str(e)}")
@@ -120,9 +106,6 @@ tema:
 
 if __name__ == "__main__":
     try:
-        # Criar pasta se não existir
-        vault_path.mkdir(parents=True, exist_ok=True)
-
         # Determinar fonte do dia
         day = datetime.today().weekday()
         fonts = ["wikipedia", "jstor", "plato", "wikipedia", "daily_stoic"]
@@ -131,8 +114,12 @@ if __name__ == "__main__":
         # Obter conteúdo estruturado
         content_data = get_content(daily_font)
 
-        # Validação reforçada
-        if not content_data.get("main") or not content_data.get("daily_stoic"):
+        # Validação reforçada (None quando todas as tentativas falharam)
+        if (
+            not content_data
+            or not content_data.get("main")
+            or not content_data.get("daily_stoic")
+        ):
             raise ValueError("Dados incompletos das fontes")
 
         # Extrair componentes da fonte principal
@@ -145,35 +132,30 @@ if __name__ == "__main__":
         category = daily_font.capitalize()  # Fallback para fonte do dia
 
         # Salvar arquivo
-        safe_title = re.sub(r'[\\/*?:"<>|]', "", title)[
-            :50
-        ]  # Remove caracteres inválidos
+        safe_title = title.translate(_UNSAFE_TBL)[:50]
         file_path = (
             vault_path
             / f"{datetime.now().strftime('%Y%m%d%H%M')} - {safe_title}.md"
         )
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(
-                create_daily_note(
-                    title=title,
-                    link=link,
-                    category=category,
-                    daily_stoic_link=daily_stoic["link"],
-                )
-            )
-
-        # Após salvar o arquivo:
-        if file_path.exists():
-            obsidian_url = (
-                f"obsidian://open?vault={quote(obsidian_vault_name)}"
-                f"&file=Inbox/{quote(file_path.name)}"
-            )
-            webbrowser.open(obsidian_url)
-        else:
-            logging.error("Falha ao criar arquivo")
-            webbrowser.open(
-                f"obsidian://vault/{quote(obsidian_vault_name)}"
-            )  # Abre só o vault
+        note = create_daily_note(
+            title=title,
+            link=link,
+            category=category,
+            daily_stoic_link=daily_stoic["link"],
+        )
+
+        # Grava em arquivo temporário e renomeia (operação atômica), para que
+        # o Obsidian nunca indexe uma nota escrita pela metade
+        tmp_path = file_path.with_suffix(".md.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(note)
+        os.replace(tmp_path, file_path)
+
+        obsidian_url = (
+            f"obsidian://open?vault={quote(obsidian_vault_name)}"
+            f"&file=Inbox/{quote(file_path.name)}"
+        )
+        webbrowser.open(obsidian_url)
 
     except Exception as e:
         logging.error(f"Erro fatal: {str(e)}")
@@ -1,10 +1,37 @@
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
-from urllib.parse import quote
-import feedparser
+from cachetools import TTLCache, cached
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from config import cache_path
+from datetime import date
+from io import BytesIO
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from threading import Lock, Thread, get_ident
+from typing import Dict, List, Optional, Tuple
+from urllib3.util.retry import Retry
+from xml.etree import ElementTree
+import hashlib
+import html
+import json
 import logging
+import os
 import random
+import re
 import requests
+import time
+
+# orjson decodifica direto dos bytes e é mais rápido; o json da biblioteca
+# padrão também aceita bytes e serve de alternativa
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 TARGET_CATEGORIES = [
     "Aracnologia",
@@ -32,8 +59,114 @@ TARGET_CATEGORIES = [
     "Tolkien",
 ]
 
-
-def get_content(source: str) -> Dict[str, str]:
+# Parâmetros fixos da API do MediaWiki e títulos das categorias-alvo. Uma só
+# consulta lista as páginas da categoria já com título e URL de cada uma
+_WIKI_PARAMS_BASE = {
+    "action": "query",
+    "generator": "categorymembers",
+    "gcmtype": "page",
+    "gcmlimit": 50,
+    "prop": "info",
+    "inprop": "url",
+    "format": "json",
+    "formatversion": 2,
+}
+_CATEGORY_TITLES = {c: f"Categoria:{c}" for c in TARGET_CATEGORIES}
+
+# Quantidade máxima de itens lidos de cada feed (os mais recentes)
+FEED_SAMPLE_SIZE = 10
+
+# Idade (s) até a qual o cache em disco de um feed é usado sem revalidação
+FEED_MAX_AGE = 3600
+
+# Namespace dos elementos de feeds Atom
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# Título dos verbetes da SEP: conteúdo do primeiro <h1> e tags internas
+_H1_RE = re.compile(rb"<h1[^>]*>(.*?)</h1>", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Espera máxima (s) entre tentativas, inclusive quando pedida via Retry-After
+RETRY_MAX_WAIT = 3.0
+
+
+class _BoundedRetry(Retry):
+    """`Retry` que limita a espera pedida pelo cabeçalho Retry-After."""
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return min(super().parse_retry_after(retry_after), RETRY_MAX_WAIT)
+
+
+# Política de `SESSION` (Wikipedia e SEP): repete respostas transitórias
+# (429/5xx) até três vezes com backoff exponencial e jitter, respeitando o
+# cabeçalho Retry-After. Uma falha de conexão é repetida uma vez; um servidor
+# que não responde no tempo de leitura não é consultado de novo, para que a
+# espera total continue limitada. Os feeds usam `HEDGE_SESSION`
+RETRY = _BoundedRetry(
+    total=3,
+    connect=1,
+    read=0,
+    backoff_factor=0.3,
+    backoff_jitter=0.2,
+    backoff_max=RETRY_MAX_WAIT,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Tempo limite (s) da conexão e da leitura da resposta, separadamente. Na
+# `SESSION`, um host fora do ar falha em cerca de 6,6 s (duas tentativas de
+# conexão) e um servidor que não responde, em cerca de 10 s. Nos feeds, a
+# reserva começa após `HEDGE_DELAY`: esses casos falham em cerca de 5 s e
+# 12 s, e uma conexão recusada é tentada duas vezes sem espera
+TIMEOUT = (3.05, 7)
+
+# Sessão compartilhada: reaproveita conexões TCP/TLS entre as fontes. Como
+# as conexões ficam abertas no pool (um por host), o nome de cada host é
+# resolvido no DNS só ao abrir a conexão, e não a cada requisição
+SESSION = requests.Session()
+# O Accept-Encoding padrão já pede gzip, e também br quando o pacote brotli
+# está instalado; as respostas chegam descompactadas em `response.content`
+SESSION.headers["User-Agent"] = "LessDumbEveryDay/1.0"
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY),
+)
+
+# Executor compartilhado para buscar as fontes em paralelo
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Requisições de reserva para feeds lentos (ver `_hedged_get`). Essa sessão
+# repete só respostas 429/5xx, até duas vezes; falhas de conexão e de
+# leitura não são repetidas pelo adaptador, pois a reserva faz esse papel
+HEDGE_DELAY = 2.0
+HEDGE_RETRY = _BoundedRetry(
+    total=2,
+    connect=0,
+    read=0,
+    backoff_factor=0.3,
+    backoff_jitter=0.2,
+    backoff_max=RETRY_MAX_WAIT,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+HEDGE_SESSION = requests.Session()
+HEDGE_SESSION.headers.update(SESSION.headers)
+HEDGE_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=HEDGE_RETRY),
+)
+
+# Entradas de feeds já obtidas (ou em obtenção) neste processo, por URL,
+# guardadas como `Future` (30 minutos)
+_FEED_ENTRIES = TTLCache(maxsize=8, ttl=1800)
+_FEED_ENTRIES_LOCK = Lock()
+
+
+def get_content(source: str) -> Optional[Dict[str, Dict[str, str]]]:
     """
     Obtém o conteúdo de uma fonte específica e o formata em um dicionário.
 
@@ -45,39 +178,57 @@ def get_content(source: str) -> Dict[str, str]:
         source (str): O nome da fonte de conteúdo a ser consultada.
 
     Returns:
-        Dict[str, str]: Um dicionário contendo:
+        Optional[Dict[str, Dict[str, str]]]: Um dicionário contendo:
             - 'main': Um dicionário com 'title' e 'link' do conteúdo principal.
             - 'daily_stoic': O conteúdo obtido do Daily Stoic.
+        Retorna `None` se o conteúdo estiver incompleto ou se ocorrer qualquer
+        erro durante a obtenção ou processamento do conteúdo.
 
     Raises:
-        ValueError: Se o conteúdo obtido estiver incompleto.
-        Exception: Para qualquer outro erro durante a obtenção ou processamento
-            do conteúdo.
+        ValueError: Se `source` não for uma das fontes de `SOURCES`.
 
     Note:
-        - A função usa `globals()` para chamar dinamicamente a função de
-            obtenção específica para a fonte fornecida.
+        - A função de obtenção é escolhida na tabela `SOURCES`.
+        - A fonte principal e o Daily Stoic são buscados em paralelo.
         - Erros são registrados usando o módulo `logging`.
     """
+    fetcher = SOURCES.get(source)
+    if fetcher is None:
+        raise ValueError(f"Fonte desconhecida: '{source}'")
 
     try:
-        content = globals()[f"get_{source}"]()
+        # Busca a fonte principal e o Daily Stoic em paralelo
+        main_future = EXECUTOR.submit(fetcher)
+        stoic_future = EXECUTOR.submit(get_daily_stoic)
 
-        # Validação rigorosa
+        content = main_future.result()
+
+        # Validação rigorosa; em caso de falha não espera pelo Daily Stoic
         if not content.get("link") or not content.get("title"):
+            stoic_future.cancel()
             raise ValueError(f"Conteúdo incompleto de {source}")
 
-        # return content
         return {
             "main": {
                 "title": content.get("title", "Título não disponível"),
                 "link": content.get("link", ""),
             },
-            "daily_stoic": get_daily_stoic(),
+            "daily_stoic": stoic_future.result(),
         }
 
     except Exception as e:
-        logging.error(f"Falha em '{source}': {str(e)}", exc_info=True)
+        _log_failure(source, e)
+        return None
+
+
+def _log_failure(source: str, error: Exception) -> None:
+    """Registra a falha de uma fonte em uma linha.
+
+    O traceback só é formatado quando o nível DEBUG está habilitado.
+    """
+    logger.error("source=%s err=%r", source, error)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Traceback de %s", source, exc_info=error)
 
 
 def generate_fallback_note(failed_sources: list) -> Dict[str, str]:
@@ -96,22 +247,165 @@ def generate_fallback_note(failed_sources: list) -> Dict[str, str]:
     }
 
 
-def fetch_feed(url: str, timeout: int = 10) -> Optional[dict]:
+def _cache_key(value: str) -> str:
+    """Gera um nome de arquivo estável para uma URL ou categoria."""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _feed_cache_file(url: str) -> Path:
+    """Retorna o arquivo de cache em disco de um feed."""
+    return cache_path / f"{_cache_key(url)}.json"
+
+
+def _save_feed_cache(
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    entries: List[Dict[str, str]],
+) -> None:
+    """Salva as entradas do feed, os validadores HTTP e o horário da busca.
+
+    Grava em um arquivo temporário e o renomeia, para que uma gravação
+    interrompida ou simultânea nunca deixe o cache truncado.
+    """
+    cache_file = _feed_cache_file(url)
+    tmp_file = cache_file.with_suffix(f".{get_ident()}.tmp")
+    try:
+        tmp_file.write_text(
+            json.dumps(
+                {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "fetched_at": time.time(),
+                    "entries": entries,
+                }
+            ),
+            encoding="utf-8",
+        )
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.error("Erro ao salvar cache do feed: %s", e)
+
+
+def _start_daemon(fn, *args, **kwargs) -> Future:
+    """Executa `fn` em uma thread daemon e devolve o `Future` do resultado.
+
+    Diferente das threads de um `ThreadPoolExecutor`, que são aguardadas ao
+    encerrar o interpretador, uma requisição de reserva que perdeu a corrida
+    não impede o processo de terminar.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    Thread(target=run, daemon=True).start()
+    return future
+
+
+def _hedged_get(
+    session: requests.Session, url: str, **kwargs
+) -> requests.Response:
+    """Faz um GET com requisição de reserva ("hedged request").
+
+    Se a resposta não chegar em `HEDGE_DELAY` segundos, dispara uma segunda
+    requisição idêntica e usa a primeira que terminar com sucesso. Se a
+    primeira falhar antes disso com erro de conexão (recusada, DNS), a
+    segunda é feita logo em seguida, como nova tentativa. Só deve ser usado
+    em GETs sem efeitos colaterais, como a leitura de feeds.
+    """
+    primary = _start_daemon(session.get, url, **kwargs)
+    done, _ = wait({primary}, timeout=HEDGE_DELAY)
+    if done:
+        if isinstance(primary.exception(), requests.ConnectionError):
+            return session.get(url, **kwargs)
+        return primary.result()
+
+    pending = {
+        primary,
+        _start_daemon(session.get, url, **kwargs),
+    }
+    while True:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        succeeded = [future for future in done if future.exception() is None]
+        if succeeded or not pending:
+            return (succeeded or list(done))[0].result()
+
+
+def _parse_entries(
+    body: bytes, limit: int = FEED_SAMPLE_SIZE
+) -> List[Dict[str, str]]:
+    """Extrai título e link dos primeiros `<item>` (RSS) ou `<entry>` (Atom).
+
+    O XML é lido incrementalmente, cada item é descartado da memória logo
+    após a leitura e a leitura para assim que `limit` itens são coletados,
+    sem processar o restante do documento. Itens sem link não são contados;
+    datas e demais campos são ignorados.
+    """
+    entries = []
+    for _, elem in ElementTree.iterparse(BytesIO(body), events=("end",)):
+        if elem.tag == "item":
+            title = elem.findtext("title")
+            link = elem.findtext("link")
+        elif elem.tag == f"{ATOM_NS}entry":
+            title = elem.findtext(f"{ATOM_NS}title")
+            link = next(
+                (
+                    link.get("href")
+                    for link in elem.iterfind(f"{ATOM_NS}link")
+                    if link.get("rel", "alternate") == "alternate"
+                ),
+                None,
+            )
+        else:
+            continue
+
+        # Libera os filhos do item já lido; só título e link são mantidos
+        elem.clear()
+        link = (link or "").strip()
+        if not link:
+            continue
+        entries.append({"title": (title or "").strip(), "link": link})
+        if len(entries) >= limit:
+            break
+    return entries
+
+
+def fetch_feed(
+    url: str,
+    timeout: Tuple[float, float] = TIMEOUT,
+    session: requests.Session = HEDGE_SESSION,
+) -> Optional[List[Dict[str, str]]]:
     """Obtém e valida feeds RSS/Atom a partir de uma URL.
 
-    Esta função faz uma requisição HTTP para a URL fornecida, tenta obter o
-    conteúdo do feed e analisá-lo usando a biblioteca `feedparser`. Se o feed
-    for válido e contiver entradas, ele é retornado como um dicionário.
-    Caso contrário, retorna `None`.
+    Esta função faz uma requisição HTTP para a URL fornecida e extrai
+    título e link das primeiras `FEED_SAMPLE_SIZE` entradas do feed. Se o
+    XML estiver malformado, a análise é refeita com a biblioteca
+    `feedparser`, que é tolerante a esses erros. Se não houver entradas,
+    retorna `None`.
+
+    As entradas ficam salvas em `config.cache_path`. Se foram obtidas há
+    menos de `FEED_MAX_AGE` segundos, são devolvidas sem nenhuma requisição.
+    Caso contrário, a requisição é condicional (`If-None-Match`/
+    `If-Modified-Since`) e, quando o servidor responde 304, as entradas
+    salvas são reutilizadas sem baixar nem analisar o feed novamente.
 
     Args:
         url (str): A URL do feed RSS/Atom a ser buscado.
-        timeout (int, opcional): Tempo limite da requisição em segundos.
-            Padrão é 10 segundos.
+        timeout (Tuple[float, float], opcional): Tempos limite de conexão
+            e de leitura, em segundos. Padrão é `TIMEOUT`.
+        session (requests.Session, opcional): Sessão HTTP usada na
+            requisição. Padrão é `HEDGE_SESSION`, que repete só respostas
+            429/5xx.
 
     Returns:
-        Optional[dict]: Um dicionário contendo o feed analisado se houver
-        entradas válidas, ou `None` caso contrário.
+        Optional[List[Dict[str, str]]]: Uma lista de dicionários com 'title' e
+        'link' das entradas, ou `None` se não houver entradas válidas.
 
     Raises:
         requests.RequestException: Se houver erro na requisição HTTP.
@@ -119,21 +413,112 @@ def fetch_feed(url: str, timeout: int = 10) -> Optional[dict]:
         Exception: Para quaisquer outros erros inesperados.
     """
     try:
-        response = requests.get(url, timeout=timeout)
+        try:
+            cached = json.loads(
+                _feed_cache_file(url).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            cached = {}  # Sem cache válido: faz a requisição completa
+
+        headers = {}
+        if cached.get("entries"):
+            # Cache recente: dispensa até a revalidação com o servidor
+            if time.time() - cached.get("fetched_at", 0) < FEED_MAX_AGE:
+                return cached["entries"]
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = _hedged_get(
+            session, url, headers=headers, timeout=timeout
+        )
+        if response.status_code == 304:
+            _save_feed_cache(
+                url,
+                response.headers.get("ETag", cached.get("etag")),
+                response.headers.get(
+                    "Last-Modified", cached.get("last_modified")
+                ),
+                cached["entries"],
+            )
+            return cached["entries"]
+
         response.raise_for_status()
-        feed = feedparser.parse(response.content)
-        return feed if feed.entries else None
+        try:
+            entries = _parse_entries(response.content)
+        except ElementTree.ParseError:
+            # Importado só aqui: o feedparser é usado apenas em feeds
+            # malformados
+            import feedparser
+
+            # Só título e link são usados: dispensa a sanitização de HTML e a
+            # resolução de URIs relativas que o feedparser faz por padrão
+            content_type = response.headers.get("Content-Type")
+            feed = feedparser.parse(
+                response.content,
+                response_headers=(
+                    {"content-type": content_type} if content_type else None
+                ),
+                resolve_relative_uris=False,
+                sanitize_html=False,
+            )
+            entries = [
+                {
+                    "title": entry.get("title", ""),
+                    "link": entry.get("link", ""),
+                }
+                for entry in feed.entries
+                if entry.get("link")
+            ][:FEED_SAMPLE_SIZE]
+
+        _save_feed_cache(
+            url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            entries,
+        )
+        return entries or None
     except Exception as e:
-        logging.error(f"Erro ao buscar feed: {str(e)}", exc_info=True)
+        _log_failure(url, e)
         return None
 
 
+def _feed_entries(feed_url: str) -> Optional[List[Dict[str, str]]]:
+    """Retorna as entradas do feed, reutilizando o resultado em memória.
+
+    Chamadas simultâneas para a mesma URL (por exemplo, o Daily Stoic como
+    fonte principal e como citação) compartilham uma única busca. Apenas
+    feeds obtidos com sucesso são guardados; falhas são tentadas de novo na
+    próxima chamada.
+    """
+    with _FEED_ENTRIES_LOCK:
+        future = _FEED_ENTRIES.get(feed_url)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _FEED_ENTRIES[feed_url] = future
+
+    if is_owner:
+        entries = None
+        try:
+            entries = fetch_feed(feed_url)
+        finally:
+            future.set_result(entries)
+            if not entries:
+                with _FEED_ENTRIES_LOCK:
+                    if _FEED_ENTRIES.get(feed_url) is future:
+                        del _FEED_ENTRIES[feed_url]
+    return future.result()
+
+
 def fetch_article_from_feed(feed_url: str, source_name: str) -> Dict[str, str]:
     """Busca e processa um artigo aleatório de um feed RSS.
 
     Esta função obtém um feed RSS/Atom a partir da URL fornecida e seleciona
     aleatoriamente um dos artigos disponíveis. Se o feed não puder ser obtido
-    ou estiver vazio, é gerada uma nota alternativa.
+    ou estiver vazio, é gerada uma nota alternativa. As entradas do feed são
+    reutilizadas por 30 minutos; o sorteio é refeito a cada chamada.
 
     Args:
         feed_url (str): A URL do feed RSS/Atom de onde o artigo será extraído.
@@ -145,53 +530,70 @@ def fetch_article_from_feed(feed_url: str, source_name: str) -> Dict[str, str]:
             selecionado.
         Se não houver artigos disponíveis, um fallback adequado é retornado.
     """
-    feed = fetch_feed(feed_url)
-    if not feed:
+    entries = _feed_entries(feed_url)
+    if not entries:
         return generate_fallback_note([source_name])
 
-    entry = random.choice(feed.entries)
+    entry = entries[random.randrange(len(entries))]
     return {
-        "title": entry.get("title", f"Artigo {source_name}"),
-        "link": entry.get("link", ""),
+        "title": entry["title"] or f"Artigo {source_name}",
+        "link": entry["link"],
     }
 
 
+@cached(TTLCache(maxsize=len(TARGET_CATEGORIES), ttl=3600), lock=Lock())
+def _list_category(category: str) -> List[Dict[str, str]]:
+    """Lista título e link das páginas de uma categoria da Wikipedia.
+
+    A listagem é salva em disco e reutilizada até o fim do dia, de modo que
+    novas execuções não fazem nenhuma requisição. Dentro do mesmo processo,
+    fica também em memória por uma hora.
+    """
+    category_path = cache_path / f"wiki-{_cache_key(category)}.json"
+    today = date.today().isoformat()
+    try:
+        cached = json.loads(category_path.read_text(encoding="utf-8"))
+        if cached.get("date") == today:
+            return cached["pages"]
+    except (OSError, ValueError, KeyError):
+        pass  # Sem cache válido: consulta a API
+
+    response = SESSION.get(
+        "https://pt.wikipedia.org/w/api.php",
+        params={**_WIKI_PARAMS_BASE, "gcmtitle": _CATEGORY_TITLES[category]},
+        timeout=TIMEOUT,
+    )
+    response.raise_for_status()
+    data = _loads(response.content)
+    pages = [
+        {"title": page["title"], "link": page["fullurl"]}
+        for page in data.get("query", {}).get("pages", [])
+        if page.get("fullurl")
+    ]
+
+    if pages:
+        try:
+            category_path.write_text(
+                json.dumps({"date": today, "pages": pages}),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            logger.error("Erro ao salvar cache da Wikipedia: %s", e)
+    return pages
+
+
 def get_wikipedia() -> Dict[str, str]:
     """Obtém artigo aleatório da Wikipedia dentro das categorias-alvo."""
     try:
         category = random.choice(TARGET_CATEGORIES)
-        response = requests.get(
-            "https://pt.wikipedia.org/w/api.php",
-            params={
-                "action": "query",
-                "list": "categorymembers",
-                "cmtitle": f"Categoria:{category}",
-                "cmtype": "page",
-                "cmlimit": 50,
-                "format": "json",
-            },
-            timeout=10,
-        )
-        response.raise_for_status()
-        pages = response.json().get("query", {}).get("categorymembers", [])
+        pages = _list_category(category)
         if not pages:
             return generate_fallback_note(["Wikipedia"])
 
-        title = random.choice(pages)["title"]
-        article_response = requests.get(
-            f"https://pt.wikipedia.org/api/rest_v1/page/summary/"
-            f"{quote(title)}",
-            params={"redirect": "true"},
-            timeout=10,
-        )
-        article_response.raise_for_status()
-        data = article_response.json()
-        return {
-            "title": data.get("title", "Artigo Desconhecido"),
-            "link": data["content_urls"]["desktop"]["page"],
-        }
+        page = random.choice(pages)
+        return {"title": page["title"], "link": page["link"]}
     except Exception as e:
-        logging.error(f"Erro Wikipedia: {str(e)}", exc_info=True)
+        _log_failure("wikipedia", e)
         return generate_fallback_note(["Wikipedia"])
 
 
@@ -203,26 +605,40 @@ def get_jstor() -> Dict[str, str]:
 def get_plato() -> Dict[str, str]:
     """Obtém verbete aleatório da Stanford Encyclopedia of Philosophy"""
     try:
-        response = requests.get(
-            "https://plato.stanford.edu/cgi-bin/encyclopedia/random"
+        response = SESSION.get(
+            "https://plato.stanford.edu/cgi-bin/encyclopedia/random",
+            timeout=TIMEOUT,
         )
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Extrai o título da entrada (está em um <h1>)
-        title_element = soup.find("h1")
-        if not title_element:
+        # Extrai o título da entrada (está em um <h1>) direto dos bytes, sem
+        # montar a árvore HTML; as páginas da SEP são servidas em UTF-8
+        match = _H1_RE.search(response.content)
+        if match:
+            raw_title = match.group(1).decode("utf-8", errors="replace")
+            title = html.unescape(_TAG_RE.sub("", raw_title)).strip()
+        else:
+            # Marcação inesperada: recorre ao parser HTML, limitado ao <h1>
+            # (importado só aqui, pois raramente é necessário)
+            from bs4 import BeautifulSoup, SoupStrainer
+
+            soup = BeautifulSoup(
+                response.content,
+                "html.parser",
+                parse_only=SoupStrainer("h1"),
+            )
+            title_element = soup.find("h1")
+            title = title_element.text.strip() if title_element else ""
+
+        if not title:
             raise ValueError("Título não encontrado na página")
 
-        title = title_element.text.strip()
-
         # Usa a URL final após o redirecionamento como link
         return {"title": title, "link": response.url}
 
     except Exception as e:
         # Em caso de erro, retorna uma entrada de fallback
-        print(f"Erro: {e}")
+        _log_failure("plato", e)
         return generate_fallback_note(["Stanford Philosophy"])
 
 
@@ -231,3 +647,12 @@ def get_daily_stoic() -> Dict[str, str]:
     return fetch_article_from_feed(
         "https://dailystoic.com/feed/", "Daily Stoic"
     )
+
+
+# Funções de obtenção disponíveis para `get_content`, por nome de fonte
+SOURCES = {
+    "wikipedia": get_wikipedia,
+    "jstor": get_jstor,
+    "plato": get_plato,
+    "daily_stoic": get_daily_stoic,
+}